@@ -54,11 +54,13 @@ async def main() -> None:
         mount.slew_to_and_follow_tle(tle=tle)
 
         while True:
-            topocentric = mount.get_topocentric_coordinate()
+            # Overlap the status poll with the 1 Hz tick, rather than blocking the loop:
+            topocentric, _ = await asyncio.gather(
+                asyncio.to_thread(mount.get_topocentric_coordinate),
+                asyncio.sleep(1),
+            )
 
             print(topocentric)
-
-            await asyncio.sleep(1)
     except asyncio.CancelledError:
         print("Operation was cancelled.")
     except KeyboardInterrupt:
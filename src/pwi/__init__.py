@@ -5,43 +5,47 @@
 
 # **************************************************************************************
 
-from .axis import PlaneWaveMountDeviceInterfaceAxis
-from .base import (
-    BaseDeviceInterface,
-    BaseDeviceParameters,
-    BaseDeviceState,
-)
-from .base_focuser import (
-    BaseFocuserDeviceInterface,
-    BaseFocuserDeviceParameters,
-    BaseFocuserMode,
-    BaseFocuserMovingState,
-)
-from .base_mount import (
-    BaseMountAlignmentMode,
-    BaseMountCalibrationPoint,
-    BaseMountDeviceInterface,
-    BaseMountDeviceParameters,
-    BaseMountSlewingState,
-    BaseMountTrackingMode,
-    BaseMountTrackingState,
-)
-from .calibration import (
-    HorizontalCalibrationParameters,
-    get_horizontal_calibration_coordinates,
-)
-from .client import PlaneWaveHTTPXClient
-from .mount import (
-    EquatorialCoordinateAtTime,
-    HorizontalCoordinateAtTime,
-    PlaneWaveMountDeviceInterface,
-    PlaneWaveMountDeviceParameters,
-    PlaneWaveMountDeviceTelemetry,
-)
-from .offsets import PlaneWaveMountDeviceInterfaceOffsets
-from .serial import is_device_connected_over_usb
-from .site import PlaneWaveMountDeviceInterfaceSite
-from .status import PlaneWaveMountDeviceInterfaceStatus
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from .axis import PlaneWaveMountDeviceInterfaceAxis
+    from .base import (
+        BaseDeviceInterface,
+        BaseDeviceParameters,
+        BaseDeviceState,
+    )
+    from .base_focuser import (
+        BaseFocuserDeviceInterface,
+        BaseFocuserDeviceParameters,
+        BaseFocuserMode,
+        BaseFocuserMovingState,
+    )
+    from .base_mount import (
+        BaseMountAlignmentMode,
+        BaseMountCalibrationPoint,
+        BaseMountDeviceInterface,
+        BaseMountDeviceParameters,
+        BaseMountSlewingState,
+        BaseMountTrackingMode,
+        BaseMountTrackingState,
+    )
+    from .calibration import (
+        HorizontalCalibrationParameters,
+        get_horizontal_calibration_coordinates,
+    )
+    from .client import PlaneWaveHTTPXClient
+    from .mount import (
+        EquatorialCoordinateAtTime,
+        HorizontalCoordinateAtTime,
+        PlaneWaveMountDeviceInterface,
+        PlaneWaveMountDeviceParameters,
+        PlaneWaveMountDeviceTelemetry,
+    )
+    from .offsets import PlaneWaveMountDeviceInterfaceOffsets
+    from .serial import is_device_connected_over_usb
+    from .site import PlaneWaveMountDeviceInterfaceSite
+    from .status import PlaneWaveMountDeviceInterfaceStatus
 
 # **************************************************************************************
 
@@ -96,3 +100,61 @@ __all__: list[str] = [
 ]
 
 # **************************************************************************************
+
+# Each public name is resolved from its submodule on first attribute access (PEP 562),
+# so that e.g., "import pwi" does not pay for importing httpx or pydantic up front:
+_LAZY_EXPORTS: Dict[str, str] = {
+    "PlaneWaveMountDeviceInterfaceAxis": ".axis",
+    "BaseDeviceInterface": ".base",
+    "BaseDeviceParameters": ".base",
+    "BaseDeviceState": ".base",
+    "BaseFocuserDeviceInterface": ".base_focuser",
+    "BaseFocuserDeviceParameters": ".base_focuser",
+    "BaseFocuserMode": ".base_focuser",
+    "BaseFocuserMovingState": ".base_focuser",
+    "BaseMountAlignmentMode": ".base_mount",
+    "BaseMountCalibrationPoint": ".base_mount",
+    "BaseMountDeviceInterface": ".base_mount",
+    "BaseMountDeviceParameters": ".base_mount",
+    "BaseMountSlewingState": ".base_mount",
+    "BaseMountTrackingMode": ".base_mount",
+    "BaseMountTrackingState": ".base_mount",
+    "HorizontalCalibrationParameters": ".calibration",
+    "get_horizontal_calibration_coordinates": ".calibration",
+    "PlaneWaveHTTPXClient": ".client",
+    "EquatorialCoordinateAtTime": ".mount",
+    "HorizontalCoordinateAtTime": ".mount",
+    "PlaneWaveMountDeviceInterface": ".mount",
+    "PlaneWaveMountDeviceParameters": ".mount",
+    "PlaneWaveMountDeviceTelemetry": ".mount",
+    "PlaneWaveMountDeviceInterfaceOffsets": ".offsets",
+    "is_device_connected_over_usb": ".serial",
+    "PlaneWaveMountDeviceInterfaceSite": ".site",
+    "PlaneWaveMountDeviceInterfaceStatus": ".status",
+}
+
+# **************************************************************************************
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_EXPORTS.get(name)
+
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module, __name__), name)
+
+    # Cache the resolved attribute on the package, so that it is only resolved once:
+    globals()[name] = value
+
+    return value
+
+
+# **************************************************************************************
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+# **************************************************************************************
@@ -141,7 +141,7 @@ class BaseDeviceInterface(ABC):
         Returns:
             bool: True if the device is connected; otherwise, False.
         """
-        return True if self.state == BaseDeviceState.CONNECTED else False
+        return self.state is BaseDeviceState.CONNECTED
 
     @abstractmethod
     def is_ready(self) -> bool:
@@ -14,7 +14,7 @@ from .base import BaseDeviceInterface, BaseDeviceParameters
 # **************************************************************************************
 
 
-class BaseFocuserMode(Enum):
+class BaseFocuserMode(str, Enum):
     """
     Enumeration of possible focuser modes.
     """
@@ -26,7 +26,7 @@ class BaseFocuserMode(Enum):
 # **************************************************************************************
 
 
-class BaseFocuserMovingState(Enum):
+class BaseFocuserMovingState(str, Enum):
     """
     Enumeration of possible focuser moving states.
     """
@@ -92,7 +92,7 @@ class BaseFocuserDeviceInterface(BaseDeviceInterface):
         Returns:
             bool: True if the focuser is moving, False otherwise.
         """
-        return self._moving_state == BaseFocuserMovingState.MOVING
+        return self._moving_state is BaseFocuserMovingState.MOVING
 
     def get_mode(self) -> BaseFocuserMode:
         """
@@ -16,7 +16,7 @@ from .base import BaseDeviceInterface, BaseDeviceParameters
 # **************************************************************************************
 
 
-class BaseMountAlignmentMode(Enum):
+class BaseMountAlignmentMode(str, Enum):
     """
     Enumeration of possible mount alignment modes.
     """
@@ -32,7 +32,7 @@ class BaseMountAlignmentMode(Enum):
 # **************************************************************************************
 
 
-class BaseMountTrackingMode(Enum):
+class BaseMountTrackingMode(str, Enum):
     """
     Enumeration of possible mount tracking modes.
     """
@@ -46,7 +46,7 @@ class BaseMountTrackingMode(Enum):
 # **************************************************************************************
 
 
-class BaseMountSlewingState(Enum):
+class BaseMountSlewingState(str, Enum):
     """
     Enumeration of possible mount slewing states.
     """
@@ -59,7 +59,7 @@ class BaseMountSlewingState(Enum):
 # **************************************************************************************
 
 
-class BaseMountTrackingState(Enum):
+class BaseMountTrackingState(str, Enum):
     """
     Enumeration of possible mount tracking states.
     """
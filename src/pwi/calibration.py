@@ -108,21 +108,15 @@ def get_horizontal_calibration_coordinates(
     ]
 
     # Create a reversed list of the same altitudes, for descending altitude values:
-    altitudes_descending = list(reversed(altitudes_ascending))
-
-    points: List[HorizontalCoordinate] = []
-
-    for index in range(number_of_azimuth_points):
-        az = index * azimuth_step
-
-        # For even index, we sweep from the minimum to maximum altitude:
-        if index % 2 == 0:
-            for alt in altitudes_ascending:
-                points.append(HorizontalCoordinate(alt=alt, az=az))
-        # For odd index, we sweep from the maximum to minimum altitude:
-        else:
-            for alt in altitudes_descending:
-                points.append(HorizontalCoordinate(alt=alt, az=az))
+    altitudes_descending = altitudes_ascending[::-1]
+
+    # Build the grid in a single pass, whereby for an even azimuth index we sweep from the
+    # minimum to maximum altitude, and for an odd index from the maximum to minimum:
+    points: List[HorizontalCoordinate] = [
+        HorizontalCoordinate(alt=alt, az=index * azimuth_step)
+        for index in range(number_of_azimuth_points)
+        for alt in (altitudes_descending if index % 2 else altitudes_ascending)
+    ]
 
     # Return the list of horizontal coordinates:
     return points
@@ -5,19 +5,131 @@
 
 # **************************************************************************************
 
-from httpx import Client, Timeout
+from math import inf
+from threading import Lock
+from time import monotonic
+from typing import Dict, Optional, Tuple
+
+from httpx import (
+    BaseTransport,
+    Client,
+    HTTPTransport,
+    Limits,
+    Response,
+    Timeout,
+)
+
+# **************************************************************************************
+
+# Keep a persistent pool of connections alive to the PWI4 server, so that the polling
+# loops (e.g., status, telemetry) do not pay for a new TCP handshake on every request:
+DEFAULT_CONNECTION_POOL_LIMITS = Limits(
+    max_keepalive_connections=20,
+    max_connections=20,
+    keepalive_expiry=60.0,
+)
+
+# **************************************************************************************
+
+# The shared clients, keyed by the (host, port, timeout, transport) they were constructed
+# with, so that all devices (e.g., mount and focuser) served by one PWI4 instance share
+# one pool:
+_CLIENTS: Dict[
+    Tuple[str, int, float, Optional[BaseTransport]], "PlaneWaveHTTPXClient"
+] = {}
+
+# Guards the shared clients when devices are constructed from multiple threads:
+_CLIENTS_LOCK = Lock()
 
 # **************************************************************************************
 
 
 class PlaneWaveHTTPXClient:
-    def __init__(self, host: str = "localhost", port: int = 8220, timeout: float = 3.0):
-        self._client = Client(
-            base_url=f"http://{host}:{port}",
-            timeout=Timeout(timeout, connect=timeout, read=timeout, write=timeout),
-        )
+    _client: Client
+
+    # The key of this client in the shared clients:
+    _key: Tuple[str, int, float, Optional[BaseTransport]]
+
+    # The number of holders currently sharing this client:
+    _references: int = 0
+
+    def __new__(
+        cls,
+        host: str = "localhost",
+        port: int = 8220,
+        timeout: float = 3.0,
+        transport: Optional[BaseTransport] = None,
+    ) -> "PlaneWaveHTTPXClient":
+        key = (host, port, timeout, transport)
+
+        with _CLIENTS_LOCK:
+            client = _CLIENTS.get(key)
+
+            if client is None:
+                client = super().__new__(cls)
+                client._key = key
+                _CLIENTS[key] = client
+
+            # Each construction is a new holder, which must release the client on close:
+            client._references += 1
+
+            return client
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 8220,
+        timeout: float = 3.0,
+        transport: Optional[BaseTransport] = None,
+    ):
+        with _CLIENTS_LOCK:
+            # If this is a shared client that has already been set up, keep its pool:
+            if "_client" in vars(self):
+                return
+
+            # The monotonic time (in seconds) of the last successful response:
+            self._last_ok_monotonic = -inf
+
+            self._client = Client(
+                base_url=f"http://{host}:{port}",
+                timeout=Timeout(timeout, connect=timeout, read=timeout, write=timeout),
+                transport=transport
+                or HTTPTransport(limits=DEFAULT_CONNECTION_POOL_LIMITS, retries=0),
+                event_hooks={"response": [self._on_response]},
+            )
+
+    @property
+    def last_ok_monotonic(self) -> float:
+        """
+        The monotonic time (in seconds) of the last successful response from the server.
+
+        Returns:
+            float: The monotonic time of the last successful response, or -inf if the
+                server has not yet responded successfully.
+        """
+        return self._last_ok_monotonic
+
+    def _on_response(self, response: Response) -> None:
+        # Record when the server last responded successfully, so that callers can rely
+        # on the connection being alive without issuing a request of their own:
+        if response.is_success:
+            self._last_ok_monotonic = monotonic()
 
     def close(self) -> None:
+        """
+        Release this holder's reference to the client, closing the underlying connection
+        pool once the last holder has released it.
+        """
+        with _CLIENTS_LOCK:
+            self._references = max(self._references - 1, 0)
+
+            if self._references:
+                return
+
+            # Ensure that the next construction creates a fresh client:
+            if _CLIENTS.get(self._key) is self:
+                del _CLIENTS[self._key]
+
         self._client.close()
 
 
@@ -9,8 +9,9 @@ import asyncio
 from concurrent.futures import ThreadPoolExecutor, TimeoutError
 from datetime import datetime, timezone
 from math import inf
-from time import sleep
-from typing import Dict, List, Literal, Optional, Tuple, TypedDict
+from threading import Lock
+from time import monotonic, sleep
+from typing import Any, Dict, List, Literal, Optional, Tuple, TypedDict
 from urllib.parse import quote, urlencode
 from warnings import warn
 
@@ -230,6 +231,13 @@ class PlaneWaveMountDeviceInterface(BaseMountDeviceInterface):
     # The list of calibration points for the mount:
     _indices: List[int] = []
 
+    # The time-to-live (in seconds) of the last status fetched from the mount:
+    _status_ttl: float = 0.05
+
+    # How recently (in seconds) the server must have responded successfully for the
+    # connection to be considered alive without a further round-trip:
+    _connection_ttl: float = 1.0
+
     def __init__(
         self,
         id: int,
@@ -268,9 +276,38 @@ class PlaneWaveMountDeviceInterface(BaseMountDeviceInterface):
         if not client:
             client = PlaneWaveHTTPXClient(host="localhost", port=8220)
 
+        # Keep a reference to the client wrapper, so that its pool configuration and
+        # lifecycle are owned by the wrapper rather than the mount:
+        self._http = client
+
         # Set the HTTP client for the mount:
         self._client = client._client
 
+        # The last status fetched from the mount (alongside the monotonic time it was
+        # fetched at and the parsed response), guarded so that status polls made in quick
+        # succession coalesce into one request:
+        self._status: Optional[
+            Tuple[float, Dict[str, Any], PlaneWaveMountDeviceInterfaceStatus]
+        ] = None
+
+        self._status_lock = Lock()
+
+        # The driver version of the mount, as validated from the first /status response:
+        self._driver_version: Optional[Tuple[int, int, int]] = None
+
+        # A single worker, reused across initialisation attempts, used to bound the time
+        # taken to initialise the mount (threads are only started on first use):
+        self._initialise_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=f"pwi-mount-{id}-initialise"
+        )
+
+        # The generation of the current connection attempt, bumped by each initialisation
+        # attempt and by disconnect(), so that a stalled attempt which resumes after being
+        # superseded cannot (re)connect the mount:
+        self._connection_generation = 0
+
+        self._connection_lock = Lock()
+
     @property
     def id(self) -> int:
         """
@@ -289,8 +326,11 @@ class PlaneWaveMountDeviceInterface(BaseMountDeviceInterface):
         """
 
         # Define the initialisation function to be run in a separate thread:
-        def do_initialise() -> None:
-            if self.state == BaseDeviceState.CONNECTED:
+        def do_initialise(generation: int) -> None:
+            def is_superseded() -> bool:
+                return generation != self._connection_generation
+
+            if is_superseded() or self.state == BaseDeviceState.CONNECTED:
                 return
 
             # We leave the device state as DISCONNECTED until connect() is called:
@@ -302,8 +342,12 @@ class PlaneWaveMountDeviceInterface(BaseMountDeviceInterface):
             # We leave the tracking state as IDLE until tracking is started:
             self._tracking_state = BaseMountTrackingState.IDLE
 
-            # If we have a device ID, attempt to connect:
-            self.connect(timeout=timeout, retries=retries)
+            # If we have a device ID, attempt to connect (this also establishes the
+            # connection pool to the PWI4 server):
+            self._connect(generation)
+
+            if is_superseded():
+                return
 
             # Get the status of the mount from the device:
             status = self.get_status()
@@ -311,45 +355,50 @@ class PlaneWaveMountDeviceInterface(BaseMountDeviceInterface):
             if not status:
                 raise RuntimeError("Status not available")
 
-            self.enable_axis(axis=0)
-
-            self.enable_axis(axis=1)
-
+            # Get the site information from the same /status response, before enabling
+            # the axes invalidates it:
             site = self.get_site()
 
             if not site:
                 raise RuntimeError("Site information not available")
 
+            if is_superseded():
+                return
+
+            self.enable_axis(axis=0)
+
+            if is_superseded():
+                return
+
+            self.enable_axis(axis=1)
+
             self._latitude = site.latitude if site.latitude else self._latitude
             self._longitude = site.longitude if site.longitude else self._longitude
             self._elevation = site.elevation if site.elevation else self._elevation
             self._LMST = site.lmst
 
-        # Keep a track of the number of attempts:
-        i = 0
-
         # Try to initialise the mount up to `retries` times, with the given timeout:
-        while i < retries:
-            with ThreadPoolExecutor(max_workers=1) as executor:
-                future = executor.submit(do_initialise)
-                try:
-                    # Block for up to `timeout` seconds to see if init completes
-                    future.result(timeout=timeout)
-                    return
-                except TimeoutError:
-                    # If we have a timeout after the retries are exhausted, raise an exception:
-                    if i == retries - 1:
-                        raise TimeoutError(
-                            f"[Mount ID {self.id}]: Did not initialize within {timeout} seconds "
-                            f"after {retries} attempts."
-                        )
-                except RuntimeError as error:
-                    # If we have a runtime error after the retries are exhausted, raise it:
-                    if i == retries - 1:
-                        raise error
-
-            # Increment the retry counter:
-            i += 1
+        for i in range(retries):
+            # Supersede any earlier attempt that has stalled, so that it becomes a no-op:
+            future = self._initialise_executor.submit(
+                do_initialise, self._supersede_connection()
+            )
+
+            try:
+                # Block for up to `timeout` seconds to see if init completes
+                future.result(timeout=timeout)
+                return
+            except TimeoutError:
+                # If we have a timeout after the retries are exhausted, raise an exception:
+                if i == retries - 1:
+                    raise TimeoutError(
+                        f"[Mount ID {self.id}]: Did not initialize within {timeout} seconds "
+                        f"after {retries} attempts."
+                    )
+            except RuntimeError as error:
+                # If we have a runtime error after the retries are exhausted, raise it:
+                if i == retries - 1:
+                    raise error
 
     def reset(self) -> None:
         """
@@ -372,11 +421,41 @@ class PlaneWaveMountDeviceInterface(BaseMountDeviceInterface):
         if self.state == BaseDeviceState.CONNECTED:
             return
 
+        self._connect(self._connection_generation)
+
+    def _connect(self, generation: int) -> None:
+        """
+        Connect to the device, unless the given connection generation is superseded
+        (e.g., by a newer initialisation attempt or by disconnect()) before the device
+        responds.
+
+        Args:
+            generation (int): The connection generation this connection belongs to.
+        """
         response = self._client.get(url="/mount/connect")
 
         response.raise_for_status()
 
-        self.state = BaseDeviceState.CONNECTED
+        with self._connection_lock:
+            if generation != self._connection_generation:
+                return
+
+            self._invalidate_status()
+
+            self._driver_version = None
+
+            self.state = BaseDeviceState.CONNECTED
+
+    def _supersede_connection(self) -> int:
+        """
+        Supersede any connection attempt that is still in flight.
+
+        Returns:
+            int: The new connection generation.
+        """
+        with self._connection_lock:
+            self._connection_generation += 1
+            return self._connection_generation
 
     def disconnect(self) -> None:
         """
@@ -385,6 +464,9 @@ class PlaneWaveMountDeviceInterface(BaseMountDeviceInterface):
         This method should handle any cleanup or shutdown procedures necessary to safely
         disconnect from the device.
         """
+        # Ensure that an initialisation attempt still in flight cannot reconnect the mount:
+        self._supersede_connection()
+
         if self.state == BaseDeviceState.DISCONNECTED:
             return
 
@@ -400,9 +482,11 @@ class PlaneWaveMountDeviceInterface(BaseMountDeviceInterface):
 
         response.raise_for_status()
 
+        self._invalidate_status()
+
         # Attempt to close off the HTTP client connection (transport and proxies):
         try:
-            self._client.close()
+            self._http.close()
         finally:
             # Set the device state to DISCONNECTED:
             self.state = BaseDeviceState.DISCONNECTED
@@ -420,13 +504,50 @@ class PlaneWaveMountDeviceInterface(BaseMountDeviceInterface):
         if self.state == BaseDeviceState.DISCONNECTED:
             return None
 
-        response = self._client.get(url="/status")
+        _, status = self._get_cached_status()
 
-        response.raise_for_status()
+        return status
 
-        data = ResponseParser(response.read()).parse()
+    def _get_cached_status(
+        self,
+    ) -> Tuple[Dict[str, Any], PlaneWaveMountDeviceInterfaceStatus]:
+        """
+        Get the parsed /status response of the device alongside the validated status,
+        reusing the last response if it was fetched within the status time-to-live.
 
-        return PlaneWaveMountDeviceInterfaceStatus.model_validate(data)
+        Returns:
+            Tuple[Dict[str, Any], PlaneWaveMountDeviceInterfaceStatus]: A shallow copy of
+                the parsed /status response, and the validated status of the device.
+
+        Raises:
+            HTTPStatusError: If the status data is invalid or missing
+        """
+        with self._status_lock:
+            # If the last status is still fresh, return it without a round-trip:
+            if self._status and monotonic() - self._status[0] < self._status_ttl:
+                return self._status[1].copy(), self._status[2]
+
+            # Stream the response lines straight into the parser, rather than first
+            # materialising the full response body:
+            with self._client.stream(method="GET", url="/status") as response:
+                response.raise_for_status()
+
+                data = ResponseParser(response.iter_lines()).parse()
+
+            # Validate against a copy, as the model validators flatten keys in-place:
+            status = PlaneWaveMountDeviceInterfaceStatus.model_validate(data.copy())
+
+            self._status = (monotonic(), data, status)
+
+            return data.copy(), status
+
+    def _invalidate_status(self) -> None:
+        """
+        Invalidate the last status fetched from the device, e.g., after a command that
+        changes the state of the device has been issued.
+        """
+        with self._status_lock:
+            self._status = None
 
     def get_site(self) -> Optional[PlaneWaveMountDeviceInterfaceSite]:
         """
@@ -441,11 +562,7 @@ class PlaneWaveMountDeviceInterface(BaseMountDeviceInterface):
         if self.state == BaseDeviceState.DISCONNECTED:
             return None
 
-        response = self._client.get(url="/status")
-
-        response.raise_for_status()
-
-        data = ResponseParser(response.read()).parse()
+        data, _ = self._get_cached_status()
 
         return PlaneWaveMountDeviceInterfaceSite.model_validate(data)
 
@@ -459,16 +576,27 @@ class PlaneWaveMountDeviceInterface(BaseMountDeviceInterface):
         if self.state == BaseDeviceState.DISCONNECTED:
             return False
 
+        cached = self._status
+
+        now = monotonic()
+
+        # If the server has responded successfully within the connection time-to-live,
+        # and a status fetched within it reported the mount as connected, skip the
+        # round-trip:
+        if (
+            cached
+            and cached[2].is_connected
+            and now - cached[0] < self._connection_ttl
+            and now - self._http.last_ok_monotonic < self._connection_ttl
+        ):
+            return self.state is BaseDeviceState.CONNECTED
+
         status = self.get_status()
 
         if not status:
             return False
 
-        return (
-            True
-            if self.state == BaseDeviceState.CONNECTED and status.is_connected
-            else False
-        )
+        return self.state is BaseDeviceState.CONNECTED and status.is_connected
 
     def is_ready(self) -> bool:
         """
@@ -486,12 +614,10 @@ class PlaneWaveMountDeviceInterface(BaseMountDeviceInterface):
             return False
 
         return (
-            True
-            if self.state == BaseDeviceState.CONNECTED
+            self.state is BaseDeviceState.CONNECTED
             and status.is_connected
             and not status.is_slewing
             and not status.is_tracking
-            else False
         )
 
     def get_name(self) -> str:
@@ -522,14 +648,16 @@ class PlaneWaveMountDeviceInterface(BaseMountDeviceInterface):
         if self.state == BaseDeviceState.DISCONNECTED:
             return 0, 0, 0
 
-        response = self._client.get(url="/status")
+        # The driver version does not change whilst connected, so only validate it once:
+        if self._driver_version:
+            return self._driver_version
 
-        response.raise_for_status()
-
-        data = ResponseParser(response.read()).parse()
+        data, _ = self._get_cached_status()
 
         model = PlaneWaveDeviceInterfaceVersion.model_validate(data)
 
+        self._driver_version = model.version
+
         return model.version
 
     def get_firmware_version(self) -> Tuple[int, int, int]:
@@ -587,11 +715,9 @@ class PlaneWaveMountDeviceInterface(BaseMountDeviceInterface):
         if self.state == BaseDeviceState.DISCONNECTED:
             return False
 
-        status = self.get_status()
-
-        mount = PlaneWaveMountDeviceInterfaceStatus.model_validate(status)
+        mount = self.get_status()
 
-        if not mount.horizontal_coordinate:
+        if not mount or not mount.horizontal_coordinate:
             return False
 
         tolerance = 0.1  # 0.1 degree of tolerance
@@ -612,6 +738,8 @@ class PlaneWaveMountDeviceInterface(BaseMountDeviceInterface):
 
         response.raise_for_status()
 
+        self._invalidate_status()
+
         while not self.is_home():
             # Sleep for 100 milliseconds:
             await asyncio.sleep(0.1)
@@ -639,6 +767,8 @@ class PlaneWaveMountDeviceInterface(BaseMountDeviceInterface):
 
         response.raise_for_status()
 
+        self._invalidate_status()
+
         while not self.is_parked():
             # Sleep for 100 milliseconds:
             sleep(0.1)
@@ -669,11 +799,9 @@ class PlaneWaveMountDeviceInterface(BaseMountDeviceInterface):
         if self.state == BaseDeviceState.DISCONNECTED:
             return False
 
-        status = self.get_status()
-
-        mount = PlaneWaveMountDeviceInterfaceStatus.model_validate(status)
+        mount = self.get_status()
 
-        if not mount.horizontal_coordinate:
+        if not mount or not mount.horizontal_coordinate:
             return False
 
         tolerance = 0.1  # 0.1 degree of tolerance
@@ -697,6 +825,8 @@ class PlaneWaveMountDeviceInterface(BaseMountDeviceInterface):
 
         response.raise_for_status()
 
+        self._invalidate_status()
+
         while not self.is_parked():
             # Sleep for 100 milliseconds:
             sleep(0.1)
@@ -909,13 +1039,7 @@ class PlaneWaveMountDeviceInterface(BaseMountDeviceInterface):
         if self.state == BaseDeviceState.DISCONNECTED:
             return None
 
-        response = self._client.get(url="/status")
-
-        response.raise_for_status()
-
-        data = ResponseParser(response.read()).parse()
-
-        status = PlaneWaveMountDeviceInterfaceStatus.model_validate(data)
+        data, status = self._get_cached_status()
 
         axis0 = data.copy()
 
@@ -1036,7 +1160,7 @@ class PlaneWaveMountDeviceInterface(BaseMountDeviceInterface):
             raise RuntimeError("Status not available")
 
         return (
-            status.is_slewing and self._slewing_state == BaseMountSlewingState.SLEWING
+            status.is_slewing and self._slewing_state is BaseMountSlewingState.SLEWING
         )
 
     def is_horizontal(self) -> bool:
@@ -1046,9 +1170,9 @@ class PlaneWaveMountDeviceInterface(BaseMountDeviceInterface):
         Returns:
             bool: True if the mount is in topocentric mode, False otherwise.
         """
-        return (
-            self._alignment_mode == BaseMountAlignmentMode.ALT_AZ
-            or self._alignment_mode == BaseMountAlignmentMode.HORIZONTAL
+        return self._alignment_mode in (
+            BaseMountAlignmentMode.ALT_AZ,
+            BaseMountAlignmentMode.HORIZONTAL,
         )
 
     def is_equatorial(self) -> bool:
@@ -1058,10 +1182,10 @@ class PlaneWaveMountDeviceInterface(BaseMountDeviceInterface):
         Returns:
             bool: True if the mount is in equatorial mode, False otherwise.
         """
-        return (
-            self._alignment_mode == BaseMountAlignmentMode.EQUATORIAL
-            or self._alignment_mode == BaseMountAlignmentMode.POLAR
-            or self._alignment_mode == BaseMountAlignmentMode.GERMAN_POLAR
+        return self._alignment_mode in (
+            BaseMountAlignmentMode.EQUATORIAL,
+            BaseMountAlignmentMode.POLAR,
+            BaseMountAlignmentMode.GERMAN_POLAR,
         )
 
     def has_slewed_to_target(self, tolerance: float = 0.1) -> bool:
@@ -1074,11 +1198,13 @@ class PlaneWaveMountDeviceInterface(BaseMountDeviceInterface):
         if self.state == BaseDeviceState.DISCONNECTED:
             return False
 
-        status = self.get_status()
-
-        mount = PlaneWaveMountDeviceInterfaceStatus.model_validate(status)
+        mount = self.get_status()
 
-        if not mount.horizontal_coordinate or not mount.apparent_equatorial_coordinate:
+        if (
+            not mount
+            or not mount.horizontal_coordinate
+            or not mount.apparent_equatorial_coordinate
+        ):
             return False
 
         return (
@@ -1143,11 +1269,7 @@ class PlaneWaveMountDeviceInterface(BaseMountDeviceInterface):
         if self.state == BaseDeviceState.DISCONNECTED:
             return None
 
-        response = self._client.get(url="/status")
-
-        response.raise_for_status()
-
-        data = ResponseParser(response.read()).parse()
+        data, _ = self._get_cached_status()
 
         # Inject the axis number into data to help model validator know which axis to extract
         data["axis_number"] = axis
@@ -1168,6 +1290,8 @@ class PlaneWaveMountDeviceInterface(BaseMountDeviceInterface):
 
         response.raise_for_status()
 
+        self._invalidate_status()
+
     def disable_axis(self, axis: Literal[0, 1] = 0) -> None:
         """
         Disable the specified axis of the mount.
@@ -1182,6 +1306,8 @@ class PlaneWaveMountDeviceInterface(BaseMountDeviceInterface):
 
         response.raise_for_status()
 
+        self._invalidate_status()
+
     def get_offsets(self) -> Optional[PlaneWaveMountDeviceInterfaceOffsets]:
         """
         Retrieve the current offsets for the mount.
@@ -1192,11 +1318,7 @@ class PlaneWaveMountDeviceInterface(BaseMountDeviceInterface):
         if self.state == BaseDeviceState.DISCONNECTED:
             return None
 
-        response = self._client.get(url="/status")
-
-        response.raise_for_status()
-
-        data = ResponseParser(response.read()).parse()
+        data, _ = self._get_cached_status()
 
         return PlaneWaveMountDeviceInterfaceOffsets.model_validate(data)
 
@@ -1231,6 +1353,8 @@ class PlaneWaveMountDeviceInterface(BaseMountDeviceInterface):
 
         response.raise_for_status()
 
+        self._invalidate_status()
+
         self._slewing_state = BaseMountSlewingState.SETTLING
 
         await asyncio.sleep(self.get_slew_settle_time())
@@ -1285,6 +1409,8 @@ class PlaneWaveMountDeviceInterface(BaseMountDeviceInterface):
 
         response.raise_for_status()
 
+        self._invalidate_status()
+
         return True
 
     def add_horizontal_coordinate_to_path(
@@ -1404,6 +1530,8 @@ class PlaneWaveMountDeviceInterface(BaseMountDeviceInterface):
 
         response.raise_for_status()
 
+        self._invalidate_status()
+
         # Return the topocentric coordinates for the path:
         return horizontal_coordinates
 
@@ -1440,13 +1568,14 @@ class PlaneWaveMountDeviceInterface(BaseMountDeviceInterface):
             safe="",
         )
 
-        # Prepare the follow TLE endpoint with the line parts as query params:
-        endpoint = f"follow_tle?{query}"
-
-        response = self._client.get(f"{self._client.base_url}/mount/{endpoint}")
+        # Prepare the follow TLE endpoint with the line parts as query params, relative to
+        # the base URL of the client (rather than re-building the absolute URL):
+        response = self._client.get(url=f"/mount/follow_tle?{query}")
 
         response.raise_for_status()
 
+        self._invalidate_status()
+
         return True
 
     def abort_slew(self) -> None:
@@ -1460,6 +1589,8 @@ class PlaneWaveMountDeviceInterface(BaseMountDeviceInterface):
 
         response.raise_for_status()
 
+        self._invalidate_status()
+
         self._slewing_state = BaseMountSlewingState.IDLE
 
     def is_tracking(self) -> bool:
@@ -1479,7 +1610,7 @@ class PlaneWaveMountDeviceInterface(BaseMountDeviceInterface):
 
         return (
             status.is_tracking
-            and self._tracking_state == BaseMountTrackingState.TRACKING
+            and self._tracking_state is BaseMountTrackingState.TRACKING
         )
 
     def start_tracking(self) -> None:
@@ -1493,6 +1624,8 @@ class PlaneWaveMountDeviceInterface(BaseMountDeviceInterface):
 
         response.raise_for_status()
 
+        self._invalidate_status()
+
         self._tracking_state = BaseMountTrackingState.TRACKING
 
     def stop_tracking(self) -> None:
@@ -1506,6 +1639,8 @@ class PlaneWaveMountDeviceInterface(BaseMountDeviceInterface):
 
         response.raise_for_status()
 
+        self._invalidate_status()
+
         self._tracking_state = BaseMountTrackingState.IDLE
 
     def get_tracking_state(self) -> BaseMountTrackingState:
@@ -1611,6 +1746,8 @@ class PlaneWaveMountDeviceInterface(BaseMountDeviceInterface):
 
         response.raise_for_status()
 
+        self._invalidate_status()
+
         self._tracking_state = BaseMountTrackingState.IDLE
 
     def model_add_point(self, point: EquatorialCoordinate) -> None:
@@ -9,12 +9,25 @@ import re
 from typing import (
     Any,
     Dict,
+    Iterable,
+    Iterator,
     List,
     Union,
 )
 
 # **************************************************************************************
 
+# Matches a single "key=value" line of a response, splitting at the first "=" (empty or
+# malformed lines, i.e., lines without an "=", do not match):
+LINE_PATTERN = re.compile(r"([^=]*)=(.*)")
+
+# **************************************************************************************
+
+# Matches a key part that includes an array index, e.g., "settings[0]":
+ARRAY_INDEX_PATTERN = re.compile(r"(.+)\[(\d+)\]")
+
+# **************************************************************************************
+
 
 class ResponsePlanTextParserToJSON:
     """
@@ -22,16 +35,18 @@ class ResponsePlanTextParserToJSON:
     It supports dot-delimited keys for nesting and array-like keys with indices.
     """
 
-    def __init__(self, raw: Union[bytes, str]) -> None:
+    def __init__(self, raw: Union[bytes, str, Iterable[str]]) -> None:
         """
         Initialize the parser with raw data.
 
         Args:
-            raw (Union[bytes, str]): The raw data to parse. It can be provided as bytes or as a string.
+            raw (Union[bytes, str, Iterable[str]]): The raw data to parse. It can be provided
+                as bytes, as a string, or as an iterable of lines (e.g., as streamed from a
+                HTTP response).
         """
         # If the input is in bytes, decode it into a string using UTF-8:
         if isinstance(raw, bytes):
-            self.data: str = raw.decode("utf-8")
+            self.data: Union[str, Iterable[str]] = raw.decode("utf-8")
         else:
             self.data = raw
 
@@ -40,7 +55,8 @@ class ResponsePlanTextParserToJSON:
         Parse the raw data into a nested dictionary.
 
         This method:
-          - Splits the raw text into individual lines.
+          - Splits the raw text into individual lines (unless the raw data is already
+            provided as an iterable of lines).
           - Ignores empty or malformed lines (lines without an "=").
           - Splits each valid line into a key and a value at the first "=" encountered.
           - Trims the key and value, converts the value to an appropriate type,
@@ -52,24 +68,22 @@ class ResponsePlanTextParserToJSON:
         # Initialize an empty dictionary to store the results:
         result: Dict[str, Any] = {}
 
-        # Process each line from the raw data:
-        for line in self.data.splitlines():
-            # Skip any empty lines (after stripping whitespace):
-            if not line.strip():
-                continue
-
-            # Skip lines that do not have an '=' sign (considered malformed):
-            if "=" not in line:
-                continue
+        lines: Iterable[str] = (
+            self.data.splitlines() if isinstance(self.data, str) else self.data
+        )
 
-            # Split the line into a key and value at the first '=' character:
-            key, value = line.split("=", 1)
+        # Match each "key=value" line from the raw data, skipping any malformed lines:
+        matches: Iterator[re.Match[str]] = (
+            match for match in map(LINE_PATTERN.match, lines) if match
+        )
 
+        # Process each "key=value" line from the raw data:
+        for match in matches:
             # Clean and convert the value, then insert the key/value pair into the nested dictionary:
             self._insert_into_dict(
                 result,
-                key.strip(),
-                self._convert_value(value.strip()),
+                match.group(1).strip(),
+                self._convert_value(match.group(2).strip()),
             )
 
         return result
@@ -91,9 +105,10 @@ class ResponsePlanTextParserToJSON:
             Union[bool, int, float, str]: The value in its appropriate type.
         """
         # Check for boolean values in a case-insensitive manner:
-        if value.lower() == "true":
+        lowered = value.lower()
+        if lowered == "true":
             return True
-        if value.lower() == "false":
+        if lowered == "false":
             return False
 
         # Try converting the string to a numeric value:
@@ -130,7 +145,7 @@ class ResponsePlanTextParserToJSON:
         # Iterate through each part of the split key:
         for i, part in enumerate(parts):
             # Check if the current part includes an array index using a regular expression:
-            array_match = re.match(r"(.+)\[(\d+)\]", part)
+            array_match = ARRAY_INDEX_PATTERN.match(part)
 
             if array_match:
                 # Extract the base key (e.g., "settings") and the index (e.g., 0):
@@ -148,6 +148,12 @@ class TestDummyFocuserDevice(unittest.TestCase):
         # Verify that the default focuser mode is ABSOLUTE
         self.assertEqual(self.focuser.get_mode(), BaseFocuserMode.ABSOLUTE)
 
+    def test_mode_and_moving_state_are_strings(self) -> None:
+        # Verify that the enums compare equal to (and serialise as) their string values
+        self.assertIsInstance(BaseFocuserMode.ABSOLUTE, str)
+        self.assertEqual(BaseFocuserMode.RELATIVE, "relative")
+        self.assertEqual(BaseFocuserMovingState.MOVING, "moving")
+
     def test_default_id(self) -> None:
         # Verify that the default device ID is 0
         self.assertEqual(self.focuser._id, 0)
@@ -0,0 +1,86 @@
+# **************************************************************************************
+
+# @package        pwi
+# @license        MIT License Copyright (c) 2025 Michael J. Roberts
+
+# **************************************************************************************
+
+import unittest
+from math import inf
+
+from httpx import MockTransport, Response
+
+from pwi.client import PlaneWaveHTTPXClient
+
+# **************************************************************************************
+
+
+class TestPlaneWaveHTTPXClient(unittest.TestCase):
+    def test_same_host_and_port_share_a_client(self):
+        # Test that clients for the same PWI4 server share one connection pool:
+        a = PlaneWaveHTTPXClient(host="localhost", port=18220)
+        b = PlaneWaveHTTPXClient(host="localhost", port=18220)
+        self.assertIs(a, b)
+        self.assertIs(a._client, b._client)
+        a.close()
+        b.close()
+
+    def test_different_port_does_not_share_a_client(self):
+        # Test that clients for different PWI4 servers do not share a connection pool:
+        a = PlaneWaveHTTPXClient(host="localhost", port=18221)
+        b = PlaneWaveHTTPXClient(host="localhost", port=18222)
+        self.assertIsNot(a, b)
+        a.close()
+        b.close()
+
+    def test_different_timeout_does_not_share_a_client(self):
+        # Test that a client is only shared when constructed with the same timeout:
+        a = PlaneWaveHTTPXClient(host="localhost", port=18225, timeout=3.0)
+        b = PlaneWaveHTTPXClient(host="localhost", port=18225, timeout=30.0)
+        self.assertIsNot(a, b)
+        self.assertEqual(b._client.timeout.read, 30.0)
+        a.close()
+        b.close()
+
+    def test_close_only_closes_after_last_holder_releases(self):
+        # Test that the shared pool stays open until every holder has closed it:
+        a = PlaneWaveHTTPXClient(host="localhost", port=18226)
+        b = PlaneWaveHTTPXClient(host="localhost", port=18226)
+        a.close()
+        self.assertFalse(b._client.is_closed)
+        b.close()
+        self.assertTrue(b._client.is_closed)
+
+    def test_closed_client_is_replaced(self):
+        # Test that a new client is created once the shared client has been closed:
+        a = PlaneWaveHTTPXClient(host="localhost", port=18223)
+        a.close()
+        b = PlaneWaveHTTPXClient(host="localhost", port=18223)
+        self.assertIsNot(a, b)
+        self.assertFalse(b._client.is_closed)
+        b.close()
+
+    def test_successful_response_updates_last_ok(self):
+        # Test that only successful responses update the last successful response time:
+        status_code = 500
+
+        client = PlaneWaveHTTPXClient(
+            host="localhost",
+            port=18224,
+            transport=MockTransport(lambda request: Response(status_code)),
+        )
+        self.assertEqual(client.last_ok_monotonic, -inf)
+        client._client.get(url="/status")
+        self.assertEqual(client.last_ok_monotonic, -inf)
+        status_code = 200
+        client._client.get(url="/status")
+        self.assertGreater(client.last_ok_monotonic, -inf)
+        client.close()
+
+
+# **************************************************************************************
+
+if __name__ == "__main__":
+    unittest.main()
+
+# **************************************************************************************
@@ -0,0 +1,85 @@
+# **************************************************************************************
+
+# @package        pwi
+# @license        MIT License Copyright (c) 2025 Michael J. Roberts
+
+# **************************************************************************************
+
+import ast
+import os
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+import pwi
+from pwi import _LAZY_EXPORTS, __all__
+
+# **************************************************************************************
+
+# The public names defined eagerly on the package itself, rather than lazily exported:
+EAGER_EXPORTS = {"__license__", "__version__", "VENDOR_ID", "PRODUCT_ID"}
+
+# **************************************************************************************
+
+
+class TestPackageExports(unittest.TestCase):
+    def test_all_matches_lazy_exports(self):
+        # Test that every public name (other than the eager ones) is lazily exported:
+        self.assertEqual(set(__all__) - EAGER_EXPORTS, set(_LAZY_EXPORTS))
+
+    def test_type_checking_imports_match_lazy_exports(self):
+        # Test that the TYPE_CHECKING imports agree with the lazy exports' modules:
+        tree = ast.parse(Path(pwi.__file__).read_text(encoding="utf-8"))
+
+        imports = {
+            alias.name: f".{node.module}"
+            for node in ast.walk(tree)
+            if isinstance(node, ast.ImportFrom) and node.level == 1 and node.module
+            for alias in node.names
+        }
+
+        self.assertEqual(imports, _LAZY_EXPORTS)
+
+    def test_every_public_name_resolves(self):
+        # Test that every public name resolves through the package:
+        for name in __all__:
+            with self.subTest(name=name):
+                self.assertIsNotNone(getattr(pwi, name))
+
+    def test_unknown_name_raises_attribute_error(self):
+        # Test that an unknown name raises an AttributeError, rather than a KeyError:
+        with self.assertRaises(AttributeError):
+            getattr(pwi, "PlaneWaveUnknownDeviceInterface")
+
+    def test_import_does_not_import_httpx_or_pydantic(self):
+        # Test that importing the package alone defers importing httpx and pydantic:
+        src = str(Path(pwi.__file__).resolve().parent.parent)
+
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(
+            path for path in (src, env.get("PYTHONPATH")) if path
+        )
+
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, pwi; "
+                "print(','.join(m for m in ('httpx', 'pydantic') if m in sys.modules))",
+            ],
+            capture_output=True,
+            check=True,
+            env=env,
+            text=True,
+        )
+
+        self.assertEqual(result.stdout.strip(), "")
+
+
+# **************************************************************************************
+
+if __name__ == "__main__":
+    unittest.main()
+
+# **************************************************************************************
@@ -0,0 +1,236 @@
+# **************************************************************************************
+
+# @package        pwi
+# @license        MIT License Copyright (c) 2025 Michael J. Roberts
+
+# **************************************************************************************
+
+import unittest
+from threading import Event, Timer
+from time import sleep
+from typing import Dict, List
+
+from httpx import MockTransport, Request, Response
+
+from pwi import (
+    BaseDeviceState,
+    BaseMountAlignmentMode,
+    PlaneWaveHTTPXClient,
+    PlaneWaveMountDeviceInterface,
+    PlaneWaveMountDeviceParameters,
+)
+
+# **************************************************************************************
+
+
+class FakePlaneWaveServer:
+    """FakePlaneWaveServer mimics the PWI4 HTTP API over a mock transport."""
+
+    def __init__(self) -> None:
+        self.paths: List[str] = []
+
+        self.status: Dict[str, str] = {
+            "mount.is_connected": "true",
+            "mount.is_slewing": "false",
+            "mount.is_tracking": "false",
+            "mount.altitude_degs": "45.0",
+            "mount.azimuth_degs": "120.0",
+            "site.latitude_degs": "33.87047",
+            "site.longitude_degs": "-118.24708",
+            "site.height_meters": "10.0",
+            "site.lmst_hours": "3.0",
+            "pwi4.version": "4.1.2.0",
+        }
+
+        # The number of upcoming /mount/connect requests to stall until released:
+        self.stalled_connects = 0
+
+        self.released = Event()
+
+        self.transport = MockTransport(self.handle)
+
+    def handle(self, request: Request) -> Response:
+        self.paths.append(request.url.path)
+
+        if request.url.path == "/mount/connect" and self.stalled_connects > 0:
+            self.stalled_connects -= 1
+            self.released.wait(timeout=5.0)
+
+        if request.url.path == "/status":
+            return Response(
+                200, text="\n".join(f"{k}={v}" for k, v in self.status.items())
+            )
+
+        return Response(200)
+
+
+# **************************************************************************************
+
+
+def get_mount(id: int, client: PlaneWaveHTTPXClient) -> PlaneWaveMountDeviceInterface:
+    params = PlaneWaveMountDeviceParameters(
+        name="PlaneWave L350 Alt-Az Mount",
+        description="Planewave Mount Interface (HTTP)",
+        alignment=BaseMountAlignmentMode.ALT_AZ,
+        latitude=33.87047,
+        longitude=-118.24708,
+        elevation=0.0,
+        did="0",
+        vid="",
+        pid="",
+    )
+
+    return PlaneWaveMountDeviceInterface(id=id, params=params, client=client)
+
+
+# **************************************************************************************
+
+
+class TestPlaneWaveMountDeviceInterfaceSharedClient(unittest.TestCase):
+    def test_disconnect_does_not_close_client_for_other_holders(self):
+        # Test that disconnecting one mount leaves the shared pool open for another:
+        server = FakePlaneWaveServer()
+        a = get_mount(0, PlaneWaveHTTPXClient(port=18300, transport=server.transport))
+        b = get_mount(1, PlaneWaveHTTPXClient(port=18300, transport=server.transport))
+        self.assertIs(a._client, b._client)
+        a.initialise()
+        b.initialise()
+        a.disconnect()
+        b.enable_axis(axis=0)
+        status = b.get_status()
+        self.assertIsNotNone(status)
+        b.disconnect()
+        self.assertTrue(b._client.is_closed)
+
+
+# **************************************************************************************
+
+
+class TestPlaneWaveMountDeviceInterfaceInitialise(unittest.TestCase):
+    def test_stalled_attempt_is_superseded_by_retry(self):
+        # Test that a stalled attempt which resumes does not run alongside the retry:
+        server = FakePlaneWaveServer()
+        server.stalled_connects = 1
+        mount = get_mount(
+            0, PlaneWaveHTTPXClient(port=18310, transport=server.transport)
+        )
+        release = Timer(0.7, server.released.set)
+        release.start()
+        try:
+            mount.initialise(timeout=0.5, retries=2)
+            self.assertEqual(mount.state, BaseDeviceState.CONNECTED)
+            self.assertEqual(server.paths.count("/mount/enable"), 2)
+        finally:
+            release.cancel()
+            server.released.set()
+        mount.disconnect()
+
+    def test_stalled_attempt_does_not_reconnect_after_disconnect(self):
+        # Test that a stalled attempt which resumes after disconnect() is a no-op:
+        server = FakePlaneWaveServer()
+        server.stalled_connects = 1
+        mount = get_mount(
+            0, PlaneWaveHTTPXClient(port=18313, transport=server.transport)
+        )
+        try:
+            with self.assertRaises(TimeoutError):
+                mount.initialise(timeout=0.2, retries=2)
+            mount.disconnect()
+        finally:
+            server.released.set()
+        # Wait for the stalled (and any queued) attempts to finish:
+        mount._initialise_executor.shutdown(wait=True)
+        self.assertEqual(mount.state, BaseDeviceState.DISCONNECTED)
+        self.assertNotIn("/mount/enable", server.paths)
+        self.assertNotIn("/status", server.paths)
+
+    def test_stalled_mount_does_not_block_other_mounts(self):
+        # Test that a mount stalled on initialise does not block another mount:
+        stalled = FakePlaneWaveServer()
+        stalled.stalled_connects = 1
+        healthy = FakePlaneWaveServer()
+        a = get_mount(0, PlaneWaveHTTPXClient(port=18311, transport=stalled.transport))
+        b = get_mount(1, PlaneWaveHTTPXClient(port=18312, transport=healthy.transport))
+        try:
+            with self.assertRaises(TimeoutError):
+                a.initialise(timeout=0.2, retries=2)
+            b.initialise(timeout=0.5, retries=2)
+            self.assertEqual(b.state, BaseDeviceState.CONNECTED)
+        finally:
+            stalled.released.set()
+
+
+# **************************************************************************************
+
+
+class TestPlaneWaveMountDeviceInterfaceStatusCache(unittest.TestCase):
+    def test_readers_within_ttl_share_one_status_request(self):
+        # Test that readers within the status time-to-live share a single /status:
+        server = FakePlaneWaveServer()
+        mount = get_mount(
+            0, PlaneWaveHTTPXClient(port=18330, transport=server.transport)
+        )
+        mount._status_ttl = 5.0
+        mount.initialise()
+        count = server.paths.count("/status")
+        mount.get_status()
+        mount.get_site()
+        self.assertEqual(server.paths.count("/status"), count + 1)
+        mount.disconnect()
+
+    def test_command_forces_status_refetch(self):
+        # Test that a state-changing command invalidates the cached status:
+        server = FakePlaneWaveServer()
+        mount = get_mount(
+            0, PlaneWaveHTTPXClient(port=18331, transport=server.transport)
+        )
+        mount._status_ttl = 5.0
+        mount.initialise()
+        mount.get_status()
+        count = server.paths.count("/status")
+        mount.enable_axis(axis=0)
+        mount.get_status()
+        self.assertEqual(server.paths.count("/status"), count + 1)
+        mount.disconnect()
+
+
+# **************************************************************************************
+
+
+class TestPlaneWaveMountDeviceInterfaceIsConnected(unittest.TestCase):
+    def test_is_connected_reuses_fresh_status(self):
+        # Test that a fresh status is trusted without another /status round-trip:
+        server = FakePlaneWaveServer()
+        mount = get_mount(
+            0, PlaneWaveHTTPXClient(port=18320, transport=server.transport)
+        )
+        mount.initialise()
+        mount.get_status()
+        count = server.paths.count("/status")
+        self.assertTrue(mount.is_connected())
+        self.assertEqual(server.paths.count("/status"), count)
+        mount.disconnect()
+
+    def test_is_connected_refetches_stale_status(self):
+        # Test that a stale status is refetched, even if the server responds to others:
+        server = FakePlaneWaveServer()
+        mount = get_mount(
+            0, PlaneWaveHTTPXClient(port=18321, transport=server.transport)
+        )
+        mount._connection_ttl = 0.05
+        mount.initialise()
+        mount.get_status()
+        server.status["mount.is_connected"] = "false"
+        sleep(0.1)
+        # Keep the connection itself fresh with a successful, non-status request:
+        mount._client.get(url="/mount/model/clear_points")
+        self.assertFalse(mount.is_connected())
+        mount.disconnect()
+
+
+# **************************************************************************************
+
+if __name__ == "__main__":
+    unittest.main()
+
+# **************************************************************************************
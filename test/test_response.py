@@ -55,6 +55,38 @@ class TestResponsePlanTextParserToJSON(unittest.TestCase):
         expected = {"key": "value"}
         self.assertEqual(result, expected)
 
+    def test_crlf_and_whitespace_parsing(self):
+        # Test that CRLF line endings and whitespace around keys and values are handled:
+        raw = b"  key1 = value1 \r\nkey2=a=b\r\n\t\r\nkey3= 1.5\r\n"
+        parser = ResponsePlanTextParserToJSON(raw)
+        result = parser.parse()
+        expected = {"key1": "value1", "key2": "a=b", "key3": 1.5}
+        self.assertEqual(result, expected)
+
+    def test_bare_cr_line_endings_parsing(self):
+        # Test that bare CR line endings are treated as line breaks:
+        raw = b"a=1\rb=2\rc=3"
+        parser = ResponsePlanTextParserToJSON(raw)
+        result = parser.parse()
+        expected = {"a": 1, "b": 2, "c": 3}
+        self.assertEqual(result, expected)
+
+    def test_non_breaking_space_around_key_parsing(self):
+        # Test that any whitespace (not only spaces and tabs) around a key is trimmed:
+        raw = "\xa0key\xa0=1".encode("utf-8")
+        parser = ResponsePlanTextParserToJSON(raw)
+        result = parser.parse()
+        expected = {"key": 1}
+        self.assertEqual(result, expected)
+
+    def test_iterable_of_lines_parsing(self):
+        # Test that an iterable of lines (e.g., a streamed response) is parsed correctly:
+        lines = iter(["a.b[0]=1", "", "incorrect line", "a.b[1]=2", "a.c=true"])
+        parser = ResponsePlanTextParserToJSON(lines)
+        result = parser.parse()
+        expected = {"a": {"b": [1, 2], "c": True}}
+        self.assertEqual(result, expected)
+
 
 # **************************************************************************************
 